@@ -8,6 +8,25 @@ import threading
 
 syslog = logging.getLogger("system")
 
+# numba is optional; without it the decay math simply runs as plain Python
+try:
+    from numba import njit as numba_njit
+except ImportError:
+    numba_njit = None
+
+def njit(signature, **options):
+    """Compile with numba when it is available and works, else keep the Python function"""
+    def decorator(fn):
+        if numba_njit is None:
+            return fn
+        try:
+            return numba_njit(signature, **options)(fn)
+        except Exception as e:
+            # e.g. a stale on-disk cache written under another module name
+            syslog.warning("Rudder Treadmill: numba unavailable for %s, using Python: %s", fn.__name__, e)
+            return fn
+    return decorator
+
 # ============================================================================
 # DEVICE DEFINITIONS
 # ============================================================================
@@ -20,6 +39,11 @@ MFG_Crosswind_V2_Default = gremlin.input_devices.JoystickDecorator(
     "Default"
 )
 
+# Physical axes on the pedals
+RUDDER_AXIS = 6
+LEFT_BRAKE_AXIS = 2
+RIGHT_BRAKE_AXIS = 1
+
 # ============================================================================
 # SETTINGS
 # ============================================================================
@@ -27,6 +51,7 @@ vjoy_forward_axis = IntegerVariable("vJoy Forward Axis", "2=Y Forward/Backward",
 vjoy_lateral_axis = IntegerVariable("vJoy Lateral Axis", "1=X Left/Right", 1, 1, 8)
 sensitivity = FloatVariable("Sensitivity", "Gain", 0.8, 0.01, 5.0)
 decay_rate = FloatVariable("Decay Rate", "Friction", 0.95, 0.1, 0.99)
+tick_interval = FloatVariable("Tick Interval", "Longest wait between decay updates (seconds)", 0.01, 0.002, 0.05)
 
 # Run hold settings
 sprint_enabled = BoolVariable("Sprint Feature Enabled", "Enable/Disable sprint button functionality", True)
@@ -40,25 +65,71 @@ TOE_BRAKE_MODE_BACKWARD = 1
 toe_brake_mode = IntegerVariable("Toe Brake Mode", "0=Crouch Toggle, 1=Backward Movement", TOE_BRAKE_MODE_CROUCH, 0, 1)
 crouch_button = IntegerVariable("Crouch Button", "vJoy button to hold for crouch", 2, 1, 32)
 
+# Normalized brake value above which a toe brake counts as pressed
+BRAKE_PRESS_THRESHOLD = 0.1
+
+# Axis values are compared at vJoy's int16 resolution to skip no-op writes
+AXIS_QUANTIZE = 32767
+
+# Decay Rate is the friction applied per 20 ms; ticks of other lengths are
+# scaled to it so the feel does not depend on how often the worker runs
+DECAY_REFERENCE_INTERVAL = 0.02
+
 class TreadmillState:
-    velocity = 0.0
-    last_rudder_pos = 0.0
-    vjoy_id = 1
-    decay_thread = None
-    decay_thread_running = False
-    thread_lock = threading.Lock()
-    
-    # Run hold state
-    is_running = False
-    above_threshold_time = None
+    # Fixed attribute layout: the callbacks and decay worker touch these
+    # fields on every tick, and slots avoid a per-access __dict__ lookup
+    __slots__ = (
+        "velocity", "last_rudder_pos", "rudder_travel", "consumed_travel",
+        "vjoy_id", "vjoy_handle", "decay_thread", "decay_cv", "worker_idle", "flush_requested",
+        "output_broken", "shutdown", "last_tick_time",
+        "is_running", "above_threshold_time",
+        "left_brake_value", "right_brake_value", "both_brakes_pressed", "forward_sign",
+        "is_crouching",
+        "fwd_axis", "lat_axis", "run_btn", "crouch_btn", "outputs_key",
+        "last_fwd_written", "last_lat_written",
+    )
     
-    # Toe brake state
-    left_brake_value = 0.0  
-    right_brake_value = 0.0
-    both_brakes_pressed = False
-    
-    # Crouch state
-    is_crouching = False
+    def __init__(self):
+        self.velocity = 0.0
+        self.last_rudder_pos = 0.0
+        # Rudder travel is handed to the decay thread through two counters with a
+        # single writer each: the rudder callback only grows rudder_travel and the
+        # decay thread only advances consumed_travel
+        self.rudder_travel = 0.0
+        self.consumed_travel = 0.0
+        self.vjoy_id = 1
+        self.vjoy_handle = None  # Handle from the latest rudder event, used by the decay worker
+        self.decay_thread = None
+        self.decay_cv = threading.Condition()  # Notified by the callbacks to wake the decay worker
+        self.worker_idle = False  # True while the decay worker waits for input at rest
+        self.flush_requested = False  # Brake input that the decay worker should apply right away
+        self.output_broken = False  # Set after the first vJoy failure to stop further writes
+        self.shutdown = False  # Set when the profile stops or the plugin is reloaded
+        self.last_tick_time = 0.0  # time.monotonic() cached by the decay thread each tick
+        
+        # Run hold state
+        self.is_running = False
+        self.above_threshold_time = None  # Monotonic timestamp
+        
+        # Toe brake state
+        self.left_brake_value = 0.0
+        self.right_brake_value = 0.0
+        self.both_brakes_pressed = False
+        self.forward_sign = 1  # -1 while both brakes are held in backward mode
+        
+        # Crouch state
+        self.is_crouching = False
+        
+        # Cached vJoy output proxies, rebuilt when the output settings change
+        self.fwd_axis = None
+        self.lat_axis = None
+        self.run_btn = None
+        self.crouch_btn = None
+        self.outputs_key = None
+        
+        # Last quantized values written to the axes (None forces the next write)
+        self.last_fwd_written = None
+        self.last_lat_written = None
 
 state = TreadmillState()
 
@@ -66,175 +137,357 @@ state = TreadmillState()
 # CORE LOGIC UPDATES
 # ============================================================================
 
-def update_run_state(vjoy_handle, current_time):
-    """Updates the sprint button state based on current velocity (Hold Logic)"""
-    try:
-        # Skip sprint logic if sprint feature is disabled or if crouching
-        if not sprint_enabled.value or state.is_crouching:
-            return
-            
-        # Get lateral movement to check if we should maintain run state
-        has_lateral_movement = state.left_brake_value > 0.1 or state.right_brake_value > 0.1
-        
-        # Check if we should START holding the sprint button
-        if not state.is_running and state.velocity >= run_threshold.value:
-            if state.above_threshold_time is None:
-                state.above_threshold_time = current_time
-            elif current_time - state.above_threshold_time >= run_duration.value:
-                state.is_running = True
-                vjoy_handle[state.vjoy_id].button(run_button.value).is_pressed = True
-                syslog.info(f"Rudder Treadmill: SPRINT HOLD ON (velocity: {state.velocity:.2f})")
-        
-        # Reset the timer if velocity dips below threshold while not yet sprinting
-        elif not state.is_running and state.velocity < run_threshold.value:
-            state.above_threshold_time = None
+def resolve_vjoy_outputs(vjoy_handle):
+    """Resolve the vJoy axis/button proxies once and reuse them until the settings change"""
+    key = (
+        state.vjoy_id,
+        vjoy_forward_axis.value,
+        vjoy_lateral_axis.value,
+        run_button.value,
+        crouch_button.value,
+    )
+    if key == state.outputs_key:
+        return
+    
+    device = vjoy_handle[state.vjoy_id]
+    state.fwd_axis = device.axis(key[1])
+    state.lat_axis = device.axis(key[2])
+    state.run_btn = device.button(key[3])
+    state.crouch_btn = device.button(key[4])
+    state.outputs_key = key
+    state.last_fwd_written = None
+    state.last_lat_written = None
+
+# Outputs go through Gremlin's per-axis/per-button proxies rather than a
+# batched UpdateVJD report: Gremlin owns the vJoy device, and a full
+# JOYSTICK_POSITION report would overwrite axes and buttons driven by the
+# rest of the profile. The shadow values below keep each tick to at most one
+# axis write plus a button write on sprint transitions.
+def write_forward_axis(forward_q):
+    """Write the forward axis from a quantized value unless it is unchanged"""
+    if forward_q == state.last_fwd_written:
+        return
+    state.fwd_axis.value = forward_q / AXIS_QUANTIZE
+    state.last_fwd_written = forward_q
 
-        # Check if we should RELEASE the sprint button
-        # We release if velocity drops significantly below the threshold AND there's no lateral movement
-        if state.is_running and state.velocity < run_threshold.value and not has_lateral_movement:
+def write_lateral_axis(value):
+    """Write the lateral axis unless the quantized value is unchanged"""
+    lateral_q = int(round(value * AXIS_QUANTIZE))
+    if lateral_q == state.last_lat_written:
+        return
+    state.lat_axis.value = lateral_q / AXIS_QUANTIZE
+    state.last_lat_written = lateral_q
+
+def release_outputs():
+    """Best-effort reset of every output so nothing stays latched in game"""
+    resets = (
+        (state.fwd_axis, "value", 0.0),
+        (state.lat_axis, "value", 0.0),
+        (state.run_btn, "is_pressed", False),
+        (state.crouch_btn, "is_pressed", False),
+    )
+    for proxy, attribute, value in resets:
+        if proxy is None:
+            continue
+        try:
+            setattr(proxy, attribute, value)
+        except Exception as e:
+            syslog.error("Rudder Treadmill: Error releasing output: %s", e)
+    state.is_running = False
+    state.last_fwd_written = None
+    state.last_lat_written = None
+
+def report_output_error(context, e):
+    """Log the first vJoy failure, release the outputs and stop all further output"""
+    if not state.output_broken:
+        if syslog.isEnabledFor(logging.ERROR):
+            syslog.error("Rudder Treadmill: Error %s, disabling output: %s", context, e)
+        release_outputs()
+        # Notify so an idle decay worker re-checks its predicate, releases
+        # again and exits instead of waiting forever
+        with state.decay_cv:
+            state.output_broken = True
+            state.decay_cv.notify_all()
+
+def update_run_state(current_time, velocity, left_brake, right_brake):
+    """Updates the sprint button state based on current velocity (Hold Logic)"""
+    # Skip sprint logic if sprint feature is disabled
+    if not sprint_enabled.value:
+        return
+    
+    # Crouching always drops sprint; releasing it here keeps the run button
+    # owned by the decay worker
+    if state.is_crouching:
+        if state.is_running:
             state.is_running = False
             state.above_threshold_time = None
-            vjoy_handle[state.vjoy_id].button(run_button.value).is_pressed = False
-            syslog.info(f"Rudder Treadmill: SPRINT HOLD OFF (velocity: {state.velocity:.2f})")
-            
-    except Exception as e:
-        syslog.error(f"Rudder Treadmill: Error updating run button: {str(e)}")
+            state.run_btn.is_pressed = False
+            syslog.info("Rudder Treadmill: SPRINT HOLD OFF (crouching)")
+        return
+        
+    # Snapshot the setting so it is read only once
+    rt = run_threshold.value
+    
+    # Nothing can change while sprinting above the threshold, or while idle
+    # below it with no hold timer pending
+    if state.is_running:
+        if velocity >= rt:
+            return
+    elif velocity < rt and state.above_threshold_time is None:
+        return
+    
+    # Get lateral movement to check if we should maintain run state
+    has_lateral_movement = left_brake > BRAKE_PRESS_THRESHOLD or right_brake > BRAKE_PRESS_THRESHOLD
+    
+    # Check if we should START holding the sprint button
+    if not state.is_running and velocity >= rt:
+        if state.above_threshold_time is None:
+            state.above_threshold_time = current_time
+        elif current_time - state.above_threshold_time >= run_duration.value:
+            state.is_running = True
+            state.run_btn.is_pressed = True
+            syslog.info("Rudder Treadmill: SPRINT HOLD ON (velocity: %.2f)", velocity)
+    
+    # Reset the timer if velocity dips below threshold while not yet sprinting
+    elif not state.is_running and velocity < rt:
+        state.above_threshold_time = None
 
-def toggle_crouch_mode(vjoy_handle):
+    # Check if we should RELEASE the sprint button
+    # We release if velocity drops significantly below the threshold AND there's no lateral movement
+    if state.is_running and velocity < rt and not has_lateral_movement:
+        state.is_running = False
+        state.above_threshold_time = None
+        state.run_btn.is_pressed = False
+        syslog.info("Rudder Treadmill: SPRINT HOLD OFF (velocity: %.2f)", velocity)
+
+def toggle_crouch_mode():
     """Toggle crouch mode on/off"""
     state.is_crouching = not state.is_crouching
     
-    try:
-        # Update crouch button state
-        vjoy_handle[state.vjoy_id].button(crouch_button.value).is_pressed = state.is_crouching
-        
-        # If we're crouching, make sure sprint is off
-        if state.is_crouching and state.is_running:
-            state.is_running = False
-            vjoy_handle[state.vjoy_id].button(run_button.value).is_pressed = False
-        
-        syslog.info(f"Rudder Treadmill: CROUCH {'ON' if state.is_crouching else 'OFF'}")
-    except Exception as e:
-        syslog.error(f"Rudder Treadmill: Error toggling crouch mode: {str(e)}")
-
-def apply_forward_movement(vjoy_handle):
-    """Calculate forward movement value based on velocity and toe brake mode"""
-    if state.velocity <= 0.01:
-        try:
-            vjoy_handle[state.vjoy_id].axis(vjoy_forward_axis.value).value = 0.0
-        except Exception as e:
-            syslog.error(f"Rudder Treadmill: Error zeroing forward axis: {str(e)}")
-        return 0.0
+    # Update crouch button state
+    state.crouch_btn.is_pressed = state.is_crouching
     
-    forward_value = state.velocity
+    # If we're crouching, have the decay worker turn sprint off
+    if state.is_crouching and state.is_running:
+        request_flush()
+    
+    syslog.info("Rudder Treadmill: CROUCH %s", "ON" if state.is_crouching else "OFF")
+
+# Explicit signatures make numba compile (or load from cache) at import time
+# instead of on the first rudder movement, which would stall the decay worker
+@njit("float64(float64, float64, float64, float64, float64)", cache=True)
+def decay_velocity(velocity, pending_delta, dr, sens, elapsed):
+    """Apply the friction for the elapsed time plus the coalesced rudder travel"""
+    velocity = min(1.0, velocity * dr ** (elapsed / DECAY_REFERENCE_INTERVAL) + pending_delta * sens)
+    if velocity < 0.01:
+        velocity = 0.0
+    return velocity
 
-    if state.both_brakes_pressed and toe_brake_mode.value == TOE_BRAKE_MODE_BACKWARD:
-        forward_value = -forward_value
+@njit("int64(float64, int64)", cache=True)
+def forward_output(velocity, forward_sign):
+    """Forward axis value quantized to vJoy's resolution"""
+    if velocity <= 0.01:
+        return 0
+    return int(round(velocity * AXIS_QUANTIZE)) * forward_sign
+
+def tick(current_time):
+    """Write the forward axis and advance the sprint hold from a single state snapshot"""
+    velocity = state.velocity
+    left_brake = state.left_brake_value
+    right_brake = state.right_brake_value
     
-    try:
-        vjoy_handle[state.vjoy_id].axis(vjoy_forward_axis.value).value = forward_value
-    except Exception as e:
-        syslog.error(f"Rudder Treadmill: Error updating forward axis: {str(e)}")
+    # Forward movement based on velocity and toe brake mode, quantized to
+    # vJoy's resolution up front so an unchanged tick skips the output step
+    write_forward_axis(forward_output(velocity, state.forward_sign))
     
-    return forward_value
+    update_run_state(current_time, velocity, left_brake, right_brake)
 
-def check_both_brakes_state(vjoy_handle):
+def check_both_brakes_state():
     """Check if both brakes are pressed/released and handle accordingly"""
-    both_pressed = state.left_brake_value > 0.1 and state.right_brake_value > 0.1
+    both_pressed = state.left_brake_value > BRAKE_PRESS_THRESHOLD and state.right_brake_value > BRAKE_PRESS_THRESHOLD
     
-    # If both brakes just got pressed, record the state
+    # If both brakes just got pressed, record the state and pick the forward
+    # direction once here rather than on every tick
     if both_pressed and not state.both_brakes_pressed:
         state.both_brakes_pressed = True
+        if toe_brake_mode.value == TOE_BRAKE_MODE_BACKWARD:
+            state.forward_sign = -1
     
     # If both brakes were pressed but now released, toggle crouch in crouch mode
     elif not both_pressed and state.both_brakes_pressed:
         state.both_brakes_pressed = False
+        state.forward_sign = 1
         if toe_brake_mode.value == TOE_BRAKE_MODE_CROUCH:
-            toggle_crouch_mode(vjoy_handle)
+            toggle_crouch_mode()
 
-def decay_loop(vjoy_handle):
-    syslog.info("Rudder Treadmill: Decay thread started")
+def stop_decay_output():
+    """Zero the forward axis and release sprint once the treadmill comes to rest"""
+    write_forward_axis(0)
+    # Don't reset lateral axis here as it's controlled directly by toe brakes
     
-    while state.decay_thread_running and state.velocity > 0:
-        current_time = time.time()
-        state.velocity *= decay_rate.value
-        if state.velocity < 0.01:
-            state.velocity = 0.0
+    # Ensure button is released when stopping
+    if state.is_running:
+        # Only release if there's no lateral movement, unless crouching
+        has_lateral_movement = state.left_brake_value > BRAKE_PRESS_THRESHOLD or state.right_brake_value > BRAKE_PRESS_THRESHOLD
+        if state.is_crouching or not has_lateral_movement:
+            state.is_running = False
+            state.run_btn.is_pressed = False
+            syslog.info("Rudder Treadmill: SPRINT HOLD OFF (velocity zero)")
+
+def needs_early_tick():
+    """Reasons to tick before the interval is up; called with decay_cv held"""
+    return state.output_broken or state.shutdown or state.flush_requested
+
+def has_decay_work():
+    """Predicate for the idle decay worker's condition; called with decay_cv held"""
+    return needs_early_tick() or state.rudder_travel != state.consumed_travel
+
+def request_flush():
+    """Ask the decay worker to tick now instead of waiting out the interval"""
+    with state.decay_cv:
+        state.flush_requested = True
+        state.decay_cv.notify()
+
+def run_decay():
+    """Tick the decay until the treadmill comes to rest"""
+    while True:
+        if state.shutdown or state.output_broken:
+            # On a failure the failing thread already released the outputs,
+            # but a tick here may have written after it did; release again
+            # so nothing stays latched
+            release_outputs()
+            return
+        
+        # Snapshot the settings once per tick
+        dr = decay_rate.value
+        sens = sensitivity.value
+        interval = tick_interval.value
         
-        apply_forward_movement(vjoy_handle)
-        update_run_state(vjoy_handle, current_time)
-        time.sleep(0.02)
+        current_time = time.monotonic()
+        elapsed = current_time - state.last_tick_time
+        state.last_tick_time = current_time
+        resolve_vjoy_outputs(state.vjoy_handle)
+        
+        # Flush the rudder travel coalesced since the previous tick
+        with state.decay_cv:
+            travel = state.rudder_travel
+            pending_delta = travel - state.consumed_travel
+            state.consumed_travel = travel
+            state.flush_requested = False
+        
+        # Travel arriving after this check is seen by the worker's wait
+        # predicate, so nothing is lost by returning here
+        if state.velocity == 0.0 and pending_delta == 0.0:
+            stop_decay_output()
+            return
+        
+        state.velocity = decay_velocity(state.velocity, pending_delta, dr, sens, elapsed)
+        
+        tick(current_time)
+        
+        # Wait out the rest of the interval so rudder travel coalesces; only
+        # a brake flush request (or shutdown/failure) ends the wait early
+        remaining = current_time + interval - time.monotonic()
+        if remaining > 0:
+            with state.decay_cv:
+                state.decay_cv.wait_for(needs_early_tick, timeout=remaining)
+
+def decay_worker():
+    """Long-lived decay thread: sleeps until rudder input arrives, then ticks to rest"""
+    syslog.info("Rudder Treadmill: Decay thread started")
     
     try:
-        vjoy_handle[state.vjoy_id].axis(vjoy_forward_axis.value).value = 0.0
-        # Don't reset lateral axis here as it's controlled directly by toe brakes
-        
-        # Ensure button is released when stopping
-        if sprint_enabled.value and state.is_running and not state.is_crouching:
-            # Only release if there's no lateral movement
-            has_lateral_movement = state.left_brake_value > 0.1 or state.right_brake_value > 0.1
-            if not has_lateral_movement:
-                state.is_running = False
-                vjoy_handle[state.vjoy_id].button(run_button.value).is_pressed = False
-                syslog.info("Rudder Treadmill: SPRINT HOLD OFF (velocity zero)")
+        while not state.output_broken and not state.shutdown:
+            with state.decay_cv:
+                state.worker_idle = True
+                state.decay_cv.wait_for(has_decay_work)
+                state.worker_idle = False
+            run_decay()
     except Exception as e:
-        syslog.error(f"Rudder Treadmill: Error cleaning up: {str(e)}")
-    
-    with state.thread_lock:
-        state.decay_thread = None
-        state.decay_thread_running = False
+        report_output_error("in decay loop", e)
     
     syslog.info("Rudder Treadmill: Decay thread stopped")
 
-@MFG_Crosswind_V2_Default.axis(6)
+@MFG_Crosswind_V2_Default.axis(RUDDER_AXIS)
 def on_rudder_move(event, vjoy):
-    current_time = time.time()
+    # Only accumulate the travel here; the decay worker turns it into
+    # velocity and vJoy output
     delta = abs(event.value - state.last_rudder_pos)
     state.last_rudder_pos = event.value
     
-    if delta > 0.001:
-        state.velocity = min(1.0, state.velocity + (delta * sensitivity.value))
-    
-    apply_forward_movement(vjoy)
-    update_run_state(vjoy, current_time)
-    
-    if state.velocity > 0:
-        with state.thread_lock:
-            if not state.decay_thread_running:
-                state.decay_thread_running = True
-                state.decay_thread = threading.Thread(
-                    target=decay_loop, 
-                    args=(vjoy,),
-                    daemon=True
-                )
-                state.decay_thread.start()
-
-@MFG_Crosswind_V2_Default.axis(2)
-def on_left_brake_move(event, vjoy):
-    # Normalize from -1.0 to 1.0 range to 0.0 to 1.0 range
-    state.left_brake_value = (event.value + 1) / 2
-    # Check if both brakes state changed
-    check_both_brakes_state(vjoy)
-    if state.both_brakes_pressed:
+    if delta > 0.001 and not state.output_broken:
+        state.vjoy_handle = vjoy
+        state.rudder_travel += delta
+        
+        # Lock-free while the worker is ticking: it picks the travel up at
+        # its next tick. Only an idle worker needs waking; one that is just
+        # going idle re-checks the travel in its wait predicate.
+        if state.worker_idle:
+            with state.decay_cv:
+                state.decay_cv.notify()
+
+@MFG_Crosswind_V2_Default.axis(LEFT_BRAKE_AXIS)
+@MFG_Crosswind_V2_Default.axis(RIGHT_BRAKE_AXIS)
+def on_brake_move(event, vjoy):
+    # Normalize from -1.0 to 1.0 range to 0.0 to 1.0 range (single multiply-add)
+    brake_value = event.value * 0.5 + 0.5
+    
+    # Left brake steers left (negative lateral), right brake steers right
+    if event.identifier == LEFT_BRAKE_AXIS:
+        was_pressed = state.left_brake_value > BRAKE_PRESS_THRESHOLD
+        state.left_brake_value = brake_value
+        lateral_value = -brake_value
+    else:
+        was_pressed = state.right_brake_value > BRAKE_PRESS_THRESHOLD
+        state.right_brake_value = brake_value
+        lateral_value = brake_value
+    
+    if state.output_broken:
         return
-    vjoy[state.vjoy_id].axis(vjoy_lateral_axis.value).value = -state.left_brake_value
-      
-    # Update run state if there's lateral movement
-    if state.velocity > 0:
-        update_run_state(vjoy, time.time())
-
-@MFG_Crosswind_V2_Default.axis(1)
-def on_right_brake_move(event, vjoy):
-    # Normalize from -1.0 to 1.0 range to 0.0 to 1.0 range
-    state.right_brake_value = (event.value + 1) / 2
-    # Check if both brakes state changed
-    check_both_brakes_state(vjoy)
-    if state.both_brakes_pressed:
+    both_before = state.both_brakes_pressed
+    sign_before = state.forward_sign
+    try:
+        resolve_vjoy_outputs(vjoy)
+        # Check if both brakes state changed
+        check_both_brakes_state()
+        if not state.both_brakes_pressed:
+            write_lateral_axis(lateral_value)
+    except Exception as e:
+        report_output_error("handling toe brake", e)
         return
-    vjoy[state.vjoy_id].axis(vjoy_lateral_axis.value).value = state.right_brake_value
     
-    # Update run state if there's lateral movement
-    if state.velocity > 0:
-        update_run_state(vjoy, time.time())
+    # Only wake the worker early when something tick() reads has changed:
+    # the brake crossing the press threshold or the both-brakes direction.
+    # Brake noise below or above the threshold leaves it on its interval.
+    changed = ((brake_value > BRAKE_PRESS_THRESHOLD) != was_pressed
+               or state.both_brakes_pressed != both_before
+               or state.forward_sign != sign_before)
+    if changed and state.velocity > 0 and not state.flush_requested:
+        request_flush()
+
+def stop_decay_worker():
+    """Wake the decay worker and let it release the outputs and exit"""
+    with state.decay_cv:
+        state.shutdown = True
+        state.decay_cv.notify_all()
+
+def stop_previous_decay_worker():
+    """Stop the worker left by a previous activation if no profile stop hook reached it"""
+    for thread in threading.enumerate():
+        if thread.name == DECAY_THREAD_NAME and hasattr(thread, "stop_decay"):
+            thread.stop_decay()
+
+# Gremlin runs this module again on every profile activation
+DECAY_THREAD_NAME = "RudderTreadmillDecay"
+stop_previous_decay_worker()
+
+if hasattr(gremlin.input_devices, "gremlin_stop"):
+    @gremlin.input_devices.gremlin_stop()
+    def on_profile_stop():
+        stop_decay_worker()
+
+state.decay_thread = threading.Thread(target=decay_worker, name=DECAY_THREAD_NAME, daemon=True)
+state.decay_thread.stop_decay = stop_decay_worker
+state.decay_thread.start()
 
 syslog.info("Rudder Treadmill: Hold-to-Sprint Logic Active")